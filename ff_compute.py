@@ -5,8 +5,193 @@ Author: Khushal Mehta
 """
 
 import sys
-from collections import defaultdict
-from typing import Dict, Set, List, Optional
+from collections import defaultdict, deque
+from typing import Callable, Dict, Set, List, Optional, Tuple
+
+# Compiled FIRST plan of a production: the bit of the symbol that ends the
+# nullable-prefix scan (None if the RHS has no terminal) and the indices of
+# the nonterminals before it
+Plan = Tuple[Optional[int], List[int]]
+
+def _first_kernel(first, nullable, symbols, prod_starts, nt_prod_ranges):
+    """
+    FIRST fixpoint over the flattened production arrays. Plain Python that
+    numba can compile; see _jit.
+    
+    Args:
+        first: FIRST bitmask per nonterminal, updated in place
+        nullable: Whether each nonterminal derives epsilon, updated in place
+        symbols: Concatenated right-hand sides (nonterminal index >= 0,
+            negated terminal bit < 0)
+        prod_starts: Start offset of each production in symbols, plus end
+        nt_prod_ranges: First production index of each nonterminal, plus end
+    """
+    # Sets only grow, so an unchanged bit total means a round changed nothing
+    total = -1
+    while True:
+        new_total = 0
+        for i in range(len(nt_prod_ranges) - 1):
+            mask = first[i]
+            while mask:
+                mask &= mask - 1
+                new_total += 1
+            if nullable[i]:
+                new_total += 1
+        if new_total == total:
+            break
+        total = new_total
+        
+        for i in range(len(nt_prod_ranges) - 1):
+            for p in range(nt_prod_ranges[i], nt_prod_ranges[i + 1]):
+                production_nullable = True
+                for k in range(prod_starts[p], prod_starts[p + 1]):
+                    symbol = symbols[k]
+                    if symbol < 0:  # Terminal
+                        first[i] |= -symbol
+                        production_nullable = False
+                        break
+                    first[i] |= first[symbol]
+                    if not nullable[symbol]:
+                        production_nullable = False
+                        break
+                if production_nullable:
+                    nullable[i] = True
+
+def _follow_kernel(follow, snapshot, first, nullable, symbols, prod_starts, nt_prod_ranges):
+    """
+    FOLLOW fixpoint over the flattened production arrays. Plain Python that
+    numba can compile; see _jit.
+    
+    Args:
+        follow: FOLLOW bitmask per nonterminal, updated in place
+        snapshot: Scratch array of -1 per nonterminal, holding FOLLOW(i) at
+            the last scan of i's productions
+        first: Converged FIRST bitmask per nonterminal
+        nullable: Converged nullability per nonterminal
+        symbols, prod_starts, nt_prod_ranges: As for _first_kernel
+    """
+    # Sets only grow, so an unchanged bit total means a round changed nothing
+    total = -1
+    while True:
+        new_total = 0
+        for i in range(len(nt_prod_ranges) - 1):
+            mask = follow[i]
+            while mask:
+                mask &= mask - 1
+                new_total += 1
+        if new_total == total:
+            break
+        total = new_total
+        
+        for i in range(len(nt_prod_ranges) - 1):
+            # FIRST is final, so i's productions only feed new bits after
+            # FOLLOW(i) itself has changed
+            if follow[i] == snapshot[i]:
+                continue
+            snapshot[i] = follow[i]
+            for p in range(nt_prod_ranges[i], nt_prod_ranges[i + 1]):
+                trailing = follow[i]
+                # Process symbols from right to left
+                for k in range(prod_starts[p + 1] - 1, prod_starts[p] - 1, -1):
+                    symbol = symbols[k]
+                    if symbol < 0:  # Terminal
+                        trailing = -symbol
+                        continue
+                    follow[symbol] |= trailing
+                    if nullable[symbol]:
+                        trailing |= first[symbol]
+                    else:
+                        trailing = first[symbol]
+
+# Kernels compiled so far, keyed by the plain Python function
+_JITTED: Dict[Callable, Callable] = {}
+
+def _jit(kernel: Callable) -> Callable:
+    """
+    Returns the numba-compiled version of a kernel, importing numba and
+    compiling on first use so the module never pays for it otherwise.
+    """
+    if kernel not in _JITTED:
+        from numba import njit
+        _JITTED[kernel] = njit(cache=True)(kernel)
+    return _JITTED[kernel]
+
+def _strongly_connected_components(
+    graph: List[List[int]]
+) -> Tuple[List[List[int]], List[int]]:
+    """
+    Iterative Tarjan's algorithm over an adjacency list.
+    
+    Args:
+        graph: graph[v] lists the nodes that v depends on
+        
+    Returns:
+        Tuple of the strongly connected components, each one listed after
+        every component it depends on, and the component number of each node
+    """
+    order = [-1] * len(graph)
+    low = [0] * len(graph)
+    on_stack = [False] * len(graph)
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+    
+    for root in range(len(graph)):
+        if order[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, edge = work[-1]
+            if edge == 0:  # First visit
+                order[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            if edge < len(graph[node]):
+                work[-1] = (node, edge + 1)
+                successor = graph[node][edge]
+                if order[successor] == -1:
+                    work.append((successor, 0))
+                elif on_stack[successor]:
+                    low[node] = min(low[node], order[successor])
+                continue
+            
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == order[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    
+    component_of = [0] * len(graph)
+    for current, members in enumerate(components):
+        for member in members:
+            component_of[member] = current
+    return components, component_of
+
+def _seed_worklist(
+    members: List[int], groups: List[list]
+) -> Tuple[deque, Set[Tuple[int, int]]]:
+    """
+    Queues every (member, item index) pair of one component once.
+    
+    Args:
+        members: Nonterminal indices of the component
+        groups: Per-nonterminal item lists (plans or productions)
+    """
+    worklist = deque(
+        (index, item_index)
+        for index in members
+        for item_index in range(len(groups[index]))
+    )
+    return worklist, set(worklist)
 
 class CFGAnalyzer:
     """
@@ -15,9 +200,11 @@ class CFGAnalyzer:
     """
     
     def __init__(self):
-        # Symbol sets
-        self.first_sets: Dict[str, Set[str]] = defaultdict(set)
-        self.follow_sets: Dict[str, Set[str]] = defaultdict(set)
+        # Symbol sets, stored as bitmasks over the terminal index; epsilon
+        # is never stored in first_sets, nullable records it instead
+        self.first_sets: Dict[str, int] = defaultdict(int)
+        self.follow_sets: Dict[str, int] = defaultdict(int)
+        self.nullable: Dict[str, bool] = defaultdict(bool)
         self.productions: Dict[str, List[List[str]]] = defaultdict(list)
         
         # Grammar symbol categories
@@ -28,6 +215,25 @@ class CFGAnalyzer:
         self.EPSILON = ''
         self.EOF_MARKER = '$$'
         self.AUGMENTED_START = "S'"
+        
+        # Terminal index: bit i of a FIRST/FOLLOW mask is terminal i
+        self.EOF_BIT = 1 << 0
+        self.term_id: Dict[str, int] = {}
+        self.term_name: List[str] = []
+        
+        # Nonterminal index and compiled productions
+        self.nt_index: Dict[str, int] = {}
+        self.nt_name: List[str] = []
+        self._nt_order: List[str] = []
+        self.prods_by_nt: List[List[List[int]]] = []
+        self.compiled_first: List[List[Plan]] = []
+        self.first_vec: List[int] = []
+        self.nullable_vec: List[bool] = []
+        self.follow_vec: List[int] = []
+        
+        # JIT-compile the fixpoints with numba; off by default since the
+        # compile time outweighs the gain on A-Z/a-z sized grammars
+        self.use_numba = False
 
     def load_grammar(self, grammar_path: str) -> None:
         """
@@ -43,23 +249,39 @@ class CFGAnalyzer:
             - Empty right-hand side represents epsilon production
         """
         # Add augmented start production
-        self._add_production(self.AUGMENTED_START, ["S", self.EOF_MARKER])
+        self.productions[self.AUGMENTED_START].append(["S", self.EOF_MARKER])
         self.nonterminals.add(self.AUGMENTED_START)
         
         try:
             with open(grammar_path) as file:
-                for line in file:
+                for number, line in enumerate(file, 1):
                     if not (line := line.strip()):
                         continue
                     
+                    # Symbols are ASCII letters only
+                    if not line.isascii():
+                        symbol = next(ch for ch in line if not ch.isascii())
+                        raise ValueError(f"Invalid symbol {symbol!r} at line {number}")
+                    
                     # Parse production rule
-                    lhs, rhs = map(str.strip, line.split("->"))
-                    self._process_production(lhs, rhs)
+                    lhs, sep, rhs = line.partition("->")
+                    if not sep or "->" in rhs:
+                        raise ValueError(f"expected exactly one '->' at line {number}: {line!r}")
+                    self._process_production(lhs.strip(), rhs)
                     
         except FileNotFoundError:
             raise FileNotFoundError(f"Grammar file not found: {grammar_path}")
         except Exception as e:
             raise ValueError(f"Error parsing grammar file: {str(e)}")
+        
+        # Duplicate productions contribute nothing new to either fixpoint
+        for nonterminal, productions in self.productions.items():
+            self.productions[nonterminal] = [
+                list(production) for production in dict.fromkeys(map(tuple, productions))
+            ]
+        
+        self._index_terminals()
+        self._compile_productions()
 
     def _process_production(self, lhs: str, rhs: str) -> None:
         """
@@ -69,111 +291,299 @@ class CFGAnalyzer:
             lhs: Left-hand side nonterminal
             rhs: Right-hand side of the production (may be empty for epsilon)
         """
-        if not rhs:  # Epsilon production
-            self._add_production(lhs, [])
-        else:
-            symbols = []
-            for symbol in rhs:
-                if symbol.isupper():
-                    self.nonterminals.add(symbol)
-                    symbols.append(symbol)
-                elif symbol.islower():
-                    self.terminals.add(symbol)
-                    symbols.append(symbol)
-            
-            self._add_production(lhs, symbols)
+        nonterminals = self.nonterminals
+        terminals = self.terminals
+        symbols = []
+        for symbol in rhs:
+            if symbol.isupper():
+                nonterminals.add(symbol)
+                symbols.append(symbol)
+            elif symbol.islower():
+                terminals.add(symbol)
+                symbols.append(symbol)
         
-        self.nonterminals.add(lhs)
+        # An empty symbol list is an epsilon production
+        self.productions[lhs].append(symbols)
+        
+        nonterminals.add(lhs)
+
+    def _index_terminals(self) -> None:
+        """
+        Assigns every terminal a bit position, reserving bit 0 for the EOF
+        marker.
+        """
+        self.term_name = [self.EOF_MARKER] + sorted(self.terminals)
+        self.term_id = {symbol: i for i, symbol in enumerate(self.term_name)}
 
-    def _add_production(self, lhs: str, rhs: List[str]) -> None:
+    def _compile_productions(self) -> None:
+        """
+        Interns every nonterminal to an integer index and compiles the
+        productions into index-based form, so the fixpoints never have to
+        hash or classify right-hand side symbols again.
+        
+        Symbols in prods_by_nt are nonterminal indices (>= 0) or negated
+        terminal bits (< 0).
         """
-        Adds a production rule to the grammar.
+        # The augmented production refers to S even if the grammar never does
+        nt_name = self.nt_name = sorted(self.nonterminals | {"S"})
+        
+        # Stable reporting order: augmented start first, then sorted
+        self._nt_order = [self.AUGMENTED_START] + [
+            symbol for symbol in nt_name
+            if symbol in self.nonterminals and symbol != self.AUGMENTED_START
+        ]
+        nt_index = self.nt_index = {symbol: i for i, symbol in enumerate(nt_name)}
+        term_id = self.term_id
+        productions = self.productions
+        prods_by_nt = self.prods_by_nt = []
+        compiled_first = self.compiled_first = []
+        
+        for nonterminal in nt_name:
+            encoded = []
+            plans = []
+            seen_plans = set()
+            for production in productions[nonterminal]:
+                symbols = [
+                    nt_index[symbol] if symbol in nt_index
+                    else -(1 << term_id[symbol])
+                    for symbol in production
+                ]
+                leader = None
+                prefix = []
+                for symbol in symbols:
+                    if symbol < 0:
+                        leader = -symbol
+                        break
+                    prefix.append(symbol)
+                encoded.append(symbols)
+                
+                # Productions sharing a leader and nullable prefix (such as
+                # A -> b and A -> bC) feed FIRST identically; keep one plan
+                if (leader, tuple(prefix)) not in seen_plans:
+                    seen_plans.add((leader, tuple(prefix)))
+                    plans.append((leader, prefix))
+            prods_by_nt.append(encoded)
+            compiled_first.append(plans)
+
+    def _numba_enabled(self) -> bool:
+        """Checks whether the numba kernels are requested and usable"""
+        # Masks must fit in a signed 64-bit integer
+        if not self.use_numba or len(self.term_name) >= 63:
+            return False
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _flatten_productions(self) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Flattens prods_by_nt into CSR-style arrays for the fixpoint kernels.
+        
+        Returns:
+            Tuple of (symbols, prod_starts, nt_prod_ranges)
+        """
+        symbols = []
+        prod_starts = [0]
+        nt_prod_ranges = [0]
+        for prods in self.prods_by_nt:
+            for production in prods:
+                symbols.extend(production)
+                prod_starts.append(len(symbols))
+            nt_prod_ranges.append(len(prod_starts) - 1)
+        return symbols, prod_starts, nt_prod_ranges
+
+    def _bits_to_symbols(self, bits: int) -> List[str]:
+        """
+        Converts a FIRST/FOLLOW bitmask back to the terminals it contains.
         
         Args:
-            lhs: Left-hand side nonterminal
-            rhs: List of symbols in the right-hand side
+            bits: Bitmask over the terminal index
         """
-        self.productions[lhs].append(rhs)
+        symbols = []
+        i = 0
+        while bits:
+            if bits & 1:
+                symbols.append(self.term_name[i])
+            bits >>= 1
+            i += 1
+        return symbols
 
     def compute_first_sets(self) -> None:
         """
-        Computes FIRST sets for all grammar symbols using iterative algorithm.
+        Computes FIRST sets for all grammar symbols using a worklist fixpoint.
         FIRST(X) contains all terminals that can begin strings derived from X.
+        Nonterminals are visited one strongly connected component at a time,
+        and a production is only re-evaluated after the FIRST set of a
+        nonterminal in the same component has grown.
         """
-        changed = True
-        while changed:
-            changed = False
-            for nonterminal in self.nonterminals:
-                for production in self.productions[nonterminal]:
-                    original_size = len(self.first_sets[nonterminal])
+        compiled_first = self.compiled_first
+        
+        if self._numba_enabled():
+            import numpy as np
+            first_array = np.zeros(len(self.nt_name), dtype=np.int64)
+            nullable_array = np.zeros(len(self.nt_name), dtype=np.bool_)
+            _jit(_first_kernel)(
+                first_array, nullable_array,
+                *(np.array(a, dtype=np.int64) for a in self._flatten_productions())
+            )
+            first_vec = self.first_vec = first_array.tolist()
+            nullable_vec = self.nullable_vec = nullable_array.tolist()
+        else:
+            first_vec = self.first_vec = [0] * len(self.nt_name)
+            nullable_vec = self.nullable_vec = [False] * len(self.nt_name)
+            
+            # Reverse index: B -> every (A, plan index) with B in A's plan prefix
+            uses: List[List[Tuple[int, int]]] = [[] for _ in self.nt_name]
+            depends_on: List[List[int]] = []
+            for index, plans in enumerate(compiled_first):
+                leaders = set()
+                for plan_index, (_, prefix) in enumerate(plans):
+                    for symbol in set(prefix):
+                        uses[symbol].append((index, plan_index))
+                    leaders.update(prefix)
+                depends_on.append(sorted(leaders))
+            
+            # Visit the dependency graph's SCCs dependencies-first; an acyclic
+            # grammar then needs exactly one evaluation per production
+            components, component = _strongly_connected_components(depends_on)
+            
+            for current, members in enumerate(components):
+                worklist, in_queue = _seed_worklist(members, compiled_first)
+                
+                while worklist:
+                    item = worklist.popleft()
+                    in_queue.discard(item)
+                    index, plan_index = item
+                    original = first_vec[index]
+                    was_nullable = nullable_vec[index]
+                    leader, prefix = compiled_first[index][plan_index]
                     
-                    if not production:  # Epsilon production
-                        self.first_sets[nonterminal].add(self.EPSILON)
-                    else:
-                        self._compute_production_first(nonterminal, production)
+                    # FIRST contribution of this production
+                    for symbol in prefix:
+                        first_vec[index] |= first_vec[symbol]
+                        if not nullable_vec[symbol]:
+                            break
+                    else:  # Every nonterminal in the prefix can derive epsilon
+                        if leader is None:
+                            nullable_vec[index] = True
+                        else:
+                            first_vec[index] |= leader
                     
-                    if len(self.first_sets[nonterminal]) > original_size:
-                        changed = True
+                    # Only productions in this SCC can still see the growth;
+                    # later ones have not been evaluated yet
+                    if first_vec[index] != original or nullable_vec[index] != was_nullable:
+                        for dependent in uses[index]:
+                            if component[dependent[0]] == current and dependent not in in_queue:
+                                in_queue.add(dependent)
+                                worklist.append(dependent)
         
-        # Add EOF marker to augmented start symbol's FIRST set
-        self.first_sets[self.AUGMENTED_START].add(self.EOF_MARKER)
-
-    def _compute_production_first(self, nonterminal: str, production: List[str]) -> None:
-        """
-        Computes FIRST set contribution from a single production.
+        first_sets = self.first_sets
+        nullable = self.nullable
+        for index, nonterminal in enumerate(self.nt_name):
+            first_sets[nonterminal] = first_vec[index]
+            nullable[nonterminal] = nullable_vec[index]
         
-        Args:
-            nonterminal: The nonterminal whose FIRST set is being computed
-            production: List of symbols in the production's right-hand side
-        """
-        for symbol in production:
-            if symbol in self.terminals:
-                self.first_sets[nonterminal].add(symbol)
-                break
-            else:  # Nonterminal
-                # Add all non-epsilon symbols from FIRST(symbol)
-                self.first_sets[nonterminal].update(
-                    self.first_sets[symbol] - {self.EPSILON}
-                )
-                if self.EPSILON not in self.first_sets[symbol]:
-                    break
-        else:  # All symbols can derive epsilon
-            self.first_sets[nonterminal].add(self.EPSILON)
+        # Add EOF marker to augmented start symbol's FIRST set
+        first_sets[self.AUGMENTED_START] |= self.EOF_BIT
 
     def compute_follow_sets(self) -> None:
         """
-        Computes FOLLOW sets for all nonterminals using iterative algorithm.
+        Computes FOLLOW sets for all nonterminals using a worklist fixpoint.
         FOLLOW(A) contains all terminals that can appear immediately after A.
+        Must be called after compute_first_sets. FOLLOW(lhs) is propagated one
+        strongly connected component of the FOLLOW-flow graph at a time.
         """
+        first_vec = self.first_vec
+        nullable_vec = self.nullable_vec
+        if len(first_vec) != len(self.nt_name):
+            raise RuntimeError("compute_first_sets must be called before compute_follow_sets")
+        
+        follow_vec = self.follow_vec = [0] * len(self.nt_name)
+        prods_by_nt = self.prods_by_nt
+        
         # Initialize FOLLOW set of augmented start symbol with EOF marker
-        self.follow_sets[self.AUGMENTED_START].add(self.EOF_MARKER)
-        
-        changed = True
-        while changed:
-            changed = False
-            for nonterminal in self.nonterminals:
-                for production in self.productions[nonterminal]:
-                    trailing = self.follow_sets[nonterminal].copy()
+        follow_vec[self.nt_index[self.AUGMENTED_START]] |= self.EOF_BIT
+        
+        if self._numba_enabled():
+            import numpy as np
+            follow = np.array(follow_vec, dtype=np.int64)
+            _jit(_follow_kernel)(
+                follow, np.full_like(follow, -1),
+                np.array(first_vec, dtype=np.int64), np.array(nullable_vec, dtype=np.bool_),
+                *(np.array(a, dtype=np.int64) for a in self._flatten_productions())
+            )
+            follow_vec = self.follow_vec = follow.tolist()
+        else:
+            # FIRST sets are final here, so the FIRST-derived part of every
+            # walk is applied once up front. sources[B] collects every A whose
+            # FOLLOW set flows into FOLLOW(B) through a nullable suffix.
+            sources: List[Set[int]] = [set() for _ in self.nt_name]
+            for index, prods in enumerate(prods_by_nt):
+                for production in prods:
+                    trailing = 0
+                    nullable_suffix = True
                     
                     # Process symbols from right to left
                     for symbol in reversed(production):
-                        if symbol in self.nonterminals:
-                            original_size = len(self.follow_sets[symbol])
-                            self.follow_sets[symbol].update(trailing)
+                        if symbol >= 0:  # Nonterminal
+                            follow_vec[symbol] |= trailing
+                            if nullable_suffix:
+                                sources[symbol].add(index)
                             
                             # Update trailing set for next symbol
-                            if self.EPSILON in self.first_sets[symbol]:
-                                trailing.update(self.first_sets[symbol] - {self.EPSILON})
+                            if nullable_vec[symbol]:
+                                trailing |= first_vec[symbol]
                             else:
-                                trailing = self.first_sets[symbol].copy()
-                            
-                            if len(self.follow_sets[symbol]) > original_size:
-                                changed = True
+                                trailing = first_vec[symbol]
+                                nullable_suffix = False
                         else:  # Terminal
-                            trailing = {symbol}
+                            trailing = -symbol
+                            nullable_suffix = False
+            
+            # Propagate FOLLOW(lhs) through nullable suffixes, visiting SCCs of
+            # the FOLLOW-flow graph so every source is final before it is used
+            components, component = _strongly_connected_components(
+                [sorted(feeders) for feeders in sources]
+            )
+            
+            # FOLLOW of the left-hand side already pushed through each production
+            snapshot: Dict[Tuple[int, int], int] = {}
+            
+            for current, members in enumerate(components):
+                worklist, in_queue = _seed_worklist(members, prods_by_nt)
+                
+                while worklist:
+                    item = worklist.popleft()
+                    in_queue.discard(item)
+                    index, prod_index = item
+                    trailing = follow_vec[index] & ~snapshot.get(item, 0)
+                    snapshot[item] = follow_vec[index]
+                    if not trailing:
+                        continue
+                    
+                    for symbol in reversed(prods_by_nt[index][prod_index]):
+                        if symbol < 0:  # Terminal
+                            break
+                        original = follow_vec[symbol]
+                        follow_vec[symbol] |= trailing
+                        
+                        # Later SCCs have not been visited yet
+                        if follow_vec[symbol] != original and component[symbol] == current:
+                            for dependent in range(len(prods_by_nt[symbol])):
+                                if (symbol, dependent) not in in_queue:
+                                    in_queue.add((symbol, dependent))
+                                    worklist.append((symbol, dependent))
+                        
+                        if not nullable_vec[symbol]:
+                            break
         
         # Clean up augmented start symbol's FOLLOW set
-        self.follow_sets[self.AUGMENTED_START].clear()
+        follow_vec[self.nt_index[self.AUGMENTED_START]] = 0
+        
+        follow_sets = self.follow_sets
+        for index, nonterminal in enumerate(self.nt_name):
+            follow_sets[nonterminal] = follow_vec[index]
 
     def write_analysis(self, output_path: str) -> None:
         """
@@ -182,33 +592,78 @@ class CFGAnalyzer:
         Args:
             output_path: Path to write the analysis results
         """
-        def sort_with_eof_last(symbols: Set[str]) -> List[str]:
+        def sort_with_eof_last(bits: int) -> List[str]:
             """Helper to sort symbols with EOF marker at the end"""
-            return sorted(
-                [sym for sym in symbols if sym != self.EPSILON],
-                key=lambda x: ('~', x) if x == self.EOF_MARKER else ('', x)
-            )
+            # Terminal bits follow sorted order, so the terminals come out
+            # sorted; only EOF (bit 0) has to be moved to the end
+            rest = self._bits_to_symbols(bits & ~self.EOF_BIT)
+            return rest + [self.EOF_MARKER] if bits & self.EOF_BIT else rest
         
         try:
             with open(output_path, 'w') as file:
-                # Order nonterminals with augmented start first
-                sorted_nonterminals = sorted(self.nonterminals - {self.AUGMENTED_START})
-                sorted_nonterminals.insert(0, self.AUGMENTED_START)
-                
-                for nonterminal in sorted_nonterminals:
-                    file.write(f"{nonterminal}\n")
+                # Build the whole report first, nonterminals with augmented
+                # start first, then write it at once
+                parts = []
+                for nonterminal in self._nt_order:
+                    parts.append(f"{nonterminal}\n")
                     
-                    # Write FIRST set
+                    # FIRST set
                     first_symbols = sort_with_eof_last(self.first_sets[nonterminal])
-                    file.write(f"{', '.join(first_symbols)}\n" if first_symbols else "\n")
+                    parts.append(f"{', '.join(first_symbols)}\n" if first_symbols else "\n")
                     
-                    # Write FOLLOW set
+                    # FOLLOW set
                     follow_symbols = sort_with_eof_last(self.follow_sets[nonterminal])
-                    file.write(f"{', '.join(follow_symbols)}\n" if follow_symbols else "\n")
+                    parts.append(f"{', '.join(follow_symbols)}\n" if follow_symbols else "\n")
+                
+                file.write("".join(parts))
                     
         except Exception as e:
             raise IOError(f"Error writing analysis to file: {str(e)}")
 
+class GrammarAnalyzer(CFGAnalyzer):
+    """
+    Thin alias of CFGAnalyzer under the names used in the README, so
+    existing callers keep working without a second implementation.
+    """
+    
+    parse_grammar_file = CFGAnalyzer.load_grammar
+    write_results = CFGAnalyzer.write_analysis
+    
+    @property
+    def grammar_rules(self) -> Dict[str, List[List[str]]]:
+        return self.productions
+    
+    @property
+    def START_SYMBOL(self) -> str:
+        return self.AUGMENTED_START
+    
+    def analyze_grammar(self) -> Dict[str, Dict[str, Set[str]]]:
+        """
+        Computes FIRST and FOLLOW sets for every nonterminal.
+        
+        Returns:
+            Dictionary with 'FIRST' and 'FOLLOW' keys mapping each
+            nonterminal to its set of symbols (FIRST includes EPSILON for
+            nullable nonterminals)
+        """
+        self.compute_first_sets()
+        self.compute_follow_sets()
+        
+        first = {}
+        for nonterminal in self._nt_order:
+            symbols = set(self._bits_to_symbols(self.first_sets[nonterminal]))
+            if self.nullable[nonterminal]:
+                symbols.add(self.EPSILON)
+            first[nonterminal] = symbols
+        
+        return {
+            'FIRST': first,
+            'FOLLOW': {
+                nonterminal: set(self._bits_to_symbols(self.follow_sets[nonterminal]))
+                for nonterminal in self._nt_order
+            },
+        }
+
 def main() -> None:
     """
     Main entry point for the grammar analyzer.
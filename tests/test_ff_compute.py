@@ -0,0 +1,121 @@
+"""
+Tests for the FIRST/FOLLOW fixpoints in ff_compute.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from importlib.util import find_spec
+
+from ff_compute import CFGAnalyzer, GrammarAnalyzer, _first_kernel, _follow_kernel
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def random_grammar(rng: random.Random) -> str:
+    """Builds a random grammar file body over a few symbols"""
+    nonterminals = rng.sample("ABCDEFGHIJKLMNOPQRTUVWXYZ", rng.randint(1, 10)) + ["S"]
+    terminals = rng.sample("abcdefghijklmnopqrstuvwxyz", rng.randint(1, 8))
+    lines = []
+    for _ in range(rng.randint(1, 25)):
+        lhs = rng.choice(nonterminals)
+        rhs = "".join(rng.choice(nonterminals + terminals) for _ in range(rng.randint(0, 5)))
+        lines.append(f"{lhs} -> {rhs}")
+    return "\n".join(lines) + "\n"
+
+
+class FixpointTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def load(self, grammar: str, use_numba: bool = False) -> CFGAnalyzer:
+        path = os.path.join(self.tmpdir.name, "grammar.txt")
+        with open(path, "w") as file:
+            file.write(grammar)
+        analyzer = CFGAnalyzer()
+        analyzer.use_numba = use_numba
+        analyzer.load_grammar(path)
+        return analyzer
+
+    def test_example_grammar(self):
+        analyzer = CFGAnalyzer()
+        analyzer.load_grammar(os.path.join(REPO_ROOT, "g.txt"))
+        analyzer.compute_first_sets()
+        analyzer.compute_follow_sets()
+        output = os.path.join(self.tmpdir.name, "out.txt")
+        analyzer.write_analysis(output)
+        with open(output) as actual, open(os.path.join(REPO_ROOT, "ff.txt")) as expected:
+            self.assertEqual(actual.read(), expected.read())
+
+    def test_grammar_analyzer_readme_example(self):
+        analyzer = GrammarAnalyzer()
+        analyzer.parse_grammar_file(os.path.join(REPO_ROOT, "g.txt"))
+        results = analyzer.analyze_grammar()
+        
+        first_sets = results['FIRST']
+        follow_sets = results['FOLLOW']
+        self.assertEqual(first_sets['A'], {'a', analyzer.EPSILON})
+        self.assertEqual(first_sets['S'], {'a', 'c', analyzer.EPSILON})
+        self.assertNotIn(analyzer.EPSILON, first_sets[analyzer.START_SYMBOL])
+        self.assertEqual(follow_sets[analyzer.START_SYMBOL], set())
+        self.assertEqual(follow_sets['A'], {'b', 'c', '$$'})
+        self.assertIs(analyzer.grammar_rules, analyzer.productions)
+        
+        output = os.path.join(self.tmpdir.name, "out.txt")
+        analyzer.write_results(output)
+        with open(output) as actual, open(os.path.join(REPO_ROOT, "ff.txt")) as expected:
+            self.assertEqual(actual.read(), expected.read())
+
+    def test_follow_requires_first(self):
+        analyzer = self.load("S -> aS\nS ->\n")
+        with self.assertRaises(RuntimeError):
+            analyzer.compute_follow_sets()
+
+    def test_non_ascii_symbol_names_line(self):
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            self.load("S -> aA\nA -> \u0410b\n")
+
+    def test_kernels_match_worklist(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            grammar = random_grammar(rng)
+            analyzer = self.load(grammar)
+            analyzer.compute_first_sets()
+            analyzer.compute_follow_sets()
+            arrays = analyzer._flatten_productions()
+            
+            first = [0] * len(analyzer.nt_name)
+            nullable = [False] * len(analyzer.nt_name)
+            _first_kernel(first, nullable, *arrays)
+            self.assertEqual(first, analyzer.first_vec, grammar)
+            self.assertEqual(nullable, analyzer.nullable_vec, grammar)
+            
+            start = analyzer.nt_index[analyzer.AUGMENTED_START]
+            follow = [0] * len(analyzer.nt_name)
+            follow[start] = analyzer.EOF_BIT
+            _follow_kernel(follow, [-1] * len(follow), first, nullable, *arrays)
+            follow[start] = 0
+            self.assertEqual(follow, analyzer.follow_vec, grammar)
+
+    @unittest.skipUnless(find_spec("numba"), "numba is not installed")
+    def test_numba_matches_worklist(self):
+        rng = random.Random(1)
+        for _ in range(50):
+            grammar = random_grammar(rng)
+            results = []
+            for use_numba in (False, True):
+                analyzer = self.load(grammar, use_numba)
+                analyzer.compute_first_sets()
+                analyzer.compute_follow_sets()
+                results.append((
+                    dict(analyzer.first_sets),
+                    dict(analyzer.nullable),
+                    dict(analyzer.follow_sets),
+                ))
+            self.assertEqual(results[0], results[1], grammar)
+
+
+if __name__ == "__main__":
+    unittest.main()